@@ -25,10 +25,12 @@ class TransportConfig(BaseSettings):
     )
 
     def get_mounts(
-        self, async_http: bool = True
+        self, async_http: bool = True, **transport_kwargs
     ) -> Dict[str, Optional[Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]]]:
         """
         Get a dictionary of httpx mount points to transport instances.
+
+        Any extra keyword arguments (e.g. http2) are passed on to every transport.
         """
         mounts = {}
         transport_cls = httpx.AsyncHTTPTransport if async_http else httpx.HTTPTransport
@@ -36,12 +38,14 @@ class TransportConfig(BaseSettings):
         # Configure specific routes
         for pattern, route in self.transport_routes.items():
             mounts[pattern] = transport_cls(
-                verify=route.verify_ssl, proxy=route.proxy_url or self.proxy_url if route.proxy else None
+                verify=route.verify_ssl,
+                proxy=route.proxy_url or self.proxy_url if route.proxy else None,
+                **transport_kwargs,
             )
 
         # Set default proxy for all routes if enabled
         if self.all_proxy:
-            mounts["all://"] = transport_cls(proxy=self.proxy_url)
+            mounts["all://"] = transport_cls(proxy=self.proxy_url, **transport_kwargs)
 
         return mounts
 
@@ -55,6 +59,8 @@ class Settings(BaseSettings):
     log_level: str = "INFO"  # The logging level to use.
     transport_config: TransportConfig = Field(default_factory=TransportConfig)  # Configuration for httpx transport.
     enable_streaming_progress: bool = False  # Whether to enable streaming progress tracking.
+    http_max_connections: int = 200  # Maximum number of concurrent upstream connections per worker.
+    http_max_keepalive_connections: int = 100  # Maximum number of idle upstream connections kept open per worker.
 
     user_agent: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"  # The user agent to use for HTTP requests.
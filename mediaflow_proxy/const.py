@@ -1,17 +1,19 @@
-SUPPORTED_RESPONSE_HEADERS = [
-    "accept-ranges",
-    "content-type",
-    "content-length",
-    "content-range",
-    "connection",
-    "transfer-encoding",
-    "last-modified",
-    "etag",
-    "cache-control",
-    "expires",
-]
+SUPPORTED_RESPONSE_HEADERS = frozenset(
+    {
+        "accept-ranges",
+        "content-type",
+        "content-length",
+        "content-range",
+        "last-modified",
+        "etag",
+        "cache-control",
+        "expires",
+    }
+)
 
-SUPPORTED_REQUEST_HEADERS = [
-    "range",
-    "if-range",
-]
+SUPPORTED_REQUEST_HEADERS = frozenset(
+    {
+        "range",
+        "if-range",
+    }
+)
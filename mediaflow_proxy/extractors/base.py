@@ -4,7 +4,7 @@ from typing import Dict, Optional, Any
 import httpx
 
 from mediaflow_proxy.configs import settings
-from mediaflow_proxy.utils.http_utils import create_httpx_client
+from mediaflow_proxy.utils.http_utils import get_shared_httpx_client
 
 
 class ExtractorError(Exception):
@@ -28,17 +28,17 @@ class BaseExtractor(ABC):
     ) -> httpx.Response:
         """Make HTTP request with error handling."""
         try:
-            async with create_httpx_client() as client:
-                request_headers = self.base_headers
-                request_headers.update(headers or {})
-                response = await client.request(
-                    method,
-                    url,
-                    headers=request_headers,
-                    **kwargs,
-                )
-                response.raise_for_status()
-                return response
+            client = get_shared_httpx_client()
+            request_headers = self.base_headers
+            request_headers.update(headers or {})
+            response = await client.request(
+                method,
+                url,
+                headers=request_headers,
+                **kwargs,
+            )
+            response.raise_for_status()
+            return response
         except httpx.HTTPError as e:
             raise ExtractorError(f"HTTP request failed: {str(e)}")
         except Exception as e:
@@ -3,7 +3,9 @@ from typing import Dict, Any
 
 from bs4 import BeautifulSoup, SoupStrainer
 
-from mediaflow_proxy.extractors.base import BaseExtractor
+from mediaflow_proxy.extractors.base import BaseExtractor, ExtractorError
+
+OKVIDEO_STRAINER = SoupStrainer("div", {"data-module": "OKVideo"})
 
 
 class OkruExtractor(BaseExtractor):
@@ -16,17 +18,19 @@ class OkruExtractor(BaseExtractor):
     async def extract(self, url: str, **kwargs) -> Dict[str, Any]:
         """Extract Okru URL."""
         response = await self._make_request(url)
-        soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("div"))
-        if soup:
+        soup = BeautifulSoup(response.text, "lxml", parse_only=OKVIDEO_STRAINER)
+        try:
             div = soup.find("div", {"data-module": "OKVideo"})
             data_options = div.get("data-options")
             data = json.loads(data_options)
             metadata = json.loads(data["flashvars"]["metadata"])
             final_url = metadata["hlsMasterPlaylistUrl"]
+        except (AttributeError, KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ExtractorError(f"Failed to extract URL components: {e}")
 
-            self.base_headers["referer"] = url
-            return {
-                "destination_url": final_url,
-                "request_headers": self.base_headers,
-                "mediaflow_endpoint": self.mediaflow_endpoint,
-            }
+        self.base_headers["referer"] = url
+        return {
+            "destination_url": final_url,
+            "request_headers": self.base_headers,
+            "mediaflow_endpoint": self.mediaflow_endpoint,
+        }
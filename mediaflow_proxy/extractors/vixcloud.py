@@ -1,11 +1,40 @@
 import json
 import re
 from typing import Dict, Any
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qsl
 
-from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html
 
 from mediaflow_proxy.extractors.base import BaseExtractor, ExtractorError
+from mediaflow_proxy.utils.cache_utils import (
+    get_cached_vixcloud_version,
+    set_cache_vixcloud_version,
+    delete_cached_vixcloud_version,
+)
+
+TOKEN_PATTERN = re.compile(r"'token':\s*'(\w+)'")
+EXPIRES_PATTERN = re.compile(r"'expires':\s*'(\d+)'")
+# Playlist query suffixes indexed by the (canPlayFHD, b) iframe flags as a two-bit number
+PLAYLIST_FLAG_SUFFIXES = ("", "&b=1", "&h=1", "&h=1&b=1")
+
+
+def build_playlist_url(script: str, iframe: str) -> str:
+    """Build the HLS playlist URL from the player script and the iframe URL."""
+    try:
+        token = TOKEN_PATTERN.search(script).group(1)
+        expires = EXPIRES_PATTERN.search(script).group(1)
+    except AttributeError:
+        raise ExtractorError("Failed to extract URL components, token or expiry not found")
+    parsed_url = urlparse(iframe)
+    _, separator, vixid = parsed_url.path.partition("/embed/")
+    if not separator:
+        raise ExtractorError("Failed to extract URL components, video ID not found")
+    # Only the presence of the FHD/b flags matters, so keep just the parameter names
+    query_keys = {key for key, _ in parse_qsl(parsed_url.query)}
+    # canPlayFHD = "h=1", b = "b=1"
+    flags = ("canPlayFHD" in query_keys) << 1 | ("b" in query_keys)
+    suffix = PLAYLIST_FLAG_SUFFIXES[flags]
+    return f"https://{parsed_url.netloc}/playlist/{vixid}.m3u8?token={token}&expires={expires}{suffix}"
 
 
 class VixCloudExtractor(BaseExtractor):
@@ -15,58 +44,70 @@ class VixCloudExtractor(BaseExtractor):
         super().__init__(*args, **kwargs)
         self.mediaflow_endpoint = "hls_manifest_proxy"
 
+    @staticmethod
+    def site_headers(domain: str) -> Dict[str, str]:
+        """Get the Referer/Origin headers of the VixCloud Parent Site."""
+        site_url = f"https://streamingcommunity.{domain}"
+        return {"Referer": f"{site_url}/", "Origin": site_url}
+
     async def version(self, domain: str) -> str:
         """Get version of VixCloud Parent Site."""
-        base_url = f"https://streamingcommunity.{domain}/richiedi-un-titolo"
-        response = await self._make_request(
-            base_url,
-            headers={
-                "Referer": f"https://streamingcommunity.{domain}/",
-                "Origin": f"https://streamingcommunity.{domain}",
-            },
-        )
+        version = await get_cached_vixcloud_version(domain)
+        if version:
+            return version
+
+        site_headers = self.site_headers(domain)
+        response = await self._make_request(f"{site_headers['Origin']}/richiedi-un-titolo", headers=site_headers)
         if response.status_code != 200:
             raise ExtractorError("Outdated Domain")
-        # Soup the response
-        soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("div", {"id": "app"}))
-        if soup:
-            # Extract version
-            try:
-                data = json.loads(soup.find("div", {"id": "app"}).get("data-page"))
-                return data["version"]
-            except (KeyError, json.JSONDecodeError, AttributeError) as e:
-                raise ExtractorError(f"Failed to parse version: {e}")
+        # Extract version
+        try:
+            root = html.document_fromstring(response.text)
+            data = json.loads(root.xpath("string(//div[@id='app']/@data-page)"))
+            version = data["version"]
+        except (KeyError, ValueError, etree.ParserError) as e:
+            raise ExtractorError(f"Failed to parse version: {e}")
+        await set_cache_vixcloud_version(domain, version)
+        return version
 
     async def extract(self, url: str, **kwargs) -> Dict[str, Any]:
         """Extract Vixcloud URL."""
-        domain = url.split("://")[1].split("/")[0].split(".")[1]
-        version = await self.version(domain)
-        response = await self._make_request(url, headers={"x-inertia": "true", "x-inertia-version": version})
-        soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("iframe"))
-        iframe = soup.find("iframe").get("src")
-        parsed_url = urlparse(iframe)
-        query_params = parse_qs(parsed_url.query)
-        response = await self._make_request(iframe, headers={"x-inertia": "true", "x-inertia-version": version})
+        domain = urlparse(url).netloc.split(".")[1]
+        version = await get_cached_vixcloud_version(domain)
+        if version:
+            try:
+                return await self._extract_with_version(url, domain, version)
+            except ExtractorError:
+                # A site deploy makes the cached version stale and Inertia rejects it with 409, so fetch it again.
+                # The failed attempt left the stale Inertia headers on base_headers, which would fail the refetch too.
+                await delete_cached_vixcloud_version(domain)
+                self.base_headers.pop("x-inertia", None)
+                self.base_headers.pop("x-inertia-version", None)
+        return await self._extract_with_version(url, domain, await self.version(domain))
+
+    async def _extract_with_version(self, url: str, domain: str, version: str) -> Dict[str, Any]:
+        """Extract Vixcloud URL using the given parent site version."""
+        # Sent explicitly so the requests do not depend on whether the version came from the cache
+        headers = {**self.site_headers(domain), "x-inertia": "true", "x-inertia-version": version}
+        response = await self._make_request(url, headers=headers)
+        try:
+            iframe = html.document_fromstring(response.text).xpath("string(//iframe/@src)")
+        except (ValueError, etree.ParserError) as e:
+            raise ExtractorError(f"Failed to parse page: {e}")
+        if not iframe:
+            raise ExtractorError("Failed to extract iframe URL")
+        response = await self._make_request(iframe, headers=headers)
 
         if response.status_code != 200:
             raise ExtractorError("Failed to extract URL components, Invalid Request")
-        soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("body"))
-        if soup:
-            script = soup.find("body").find("script").text
-            token = re.search(r"'token':\s*'(\w+)'", script).group(1)
-            expires = re.search(r"'expires':\s*'(\d+)'", script).group(1)
-            vixid = iframe.split("/embed/")[1].split("?")[0]
-            base_url = iframe.split("://")[1].split("/")[0]
-            final_url = f"https://{base_url}/playlist/{vixid}.m3u8?token={token}&expires={expires}"
-            if "canPlayFHD" in query_params:
-                # canPlayFHD = "h=1"
-                final_url += "&h=1"
-            if "b" in query_params:
-                # b = "b=1"
-                final_url += "&b=1"
-            self.base_headers["referer"] = url
-            return {
-                "destination_url": final_url,
-                "request_headers": self.base_headers,
-                "mediaflow_endpoint": self.mediaflow_endpoint,
-            }
+        try:
+            script = html.document_fromstring(response.text).xpath("string((//body//script)[1])")
+        except (ValueError, etree.ParserError) as e:
+            raise ExtractorError(f"Failed to parse iframe page: {e}")
+        final_url = build_playlist_url(script, iframe)
+        self.base_headers["referer"] = url
+        return {
+            "destination_url": final_url,
+            "request_headers": self.base_headers,
+            "mediaflow_endpoint": self.mediaflow_endpoint,
+        }
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import logging
 from urllib.parse import urlparse
@@ -9,7 +10,7 @@ from starlette.background import BackgroundTask
 from .const import SUPPORTED_RESPONSE_HEADERS
 from .mpd_processor import process_manifest, process_playlist, process_segment
 from .schemas import HLSManifestParams, ProxyStreamParams, MPDManifestParams, MPDPlaylistParams, MPDSegmentParams
-from .utils.cache_utils import get_cached_mpd, get_cached_init_segment
+from .utils.cache_utils import get_cached_mpd, get_cached_init_segment, get_cached_public_ip, set_cache_public_ip
 from .utils.http_utils import (
     Streamer,
     DownloadError,
@@ -17,7 +18,7 @@ from .utils.http_utils import (
     request_with_retry,
     EnhancedStreamingResponse,
     ProxyRequestHeaders,
-    create_httpx_client,
+    get_shared_httpx_client,
 )
 from .utils.m3u8_processor import M3U8Processor
 from .utils.mpd_utils import pad_base64
@@ -30,9 +31,9 @@ async def setup_client_and_streamer() -> tuple[httpx.AsyncClient, Streamer]:
     Set up an HTTP client and a streamer.
 
     Returns:
-        tuple: An httpx.AsyncClient instance and a Streamer instance.
+        tuple: The shared httpx.AsyncClient instance and a Streamer instance.
     """
-    client = create_httpx_client()
+    client = get_shared_httpx_client()
     return client, Streamer(client)
 
 
@@ -156,8 +157,9 @@ def prepare_response_headers(original_headers, proxy_response_headers) -> dict:
     """
     Prepare response headers for the proxy response.
 
-    This function filters the original headers, ensures proper transfer encoding,
-    and merges them with the proxy response headers.
+    This function filters the original headers and merges them with the proxy response headers.
+    Hop-by-hop headers such as Connection and Transfer-Encoding are not forwarded, as they describe
+    the upstream connection rather than the one to the client.
 
     Args:
         original_headers (httpx.Headers): The original headers from the upstream response.
@@ -332,8 +334,11 @@ async def get_segment(
         Response: The HTTP response with the processed segment.
     """
     try:
-        init_content = await get_cached_init_segment(segment_params.init_url, proxy_headers.request)
-        segment_content = await download_file_with_retry(segment_params.segment_url, proxy_headers.request)
+        # The init segment and the media segment are independent, so fetch them concurrently
+        init_content, segment_content = await asyncio.gather(
+            get_cached_init_segment(segment_params.init_url, proxy_headers.request),
+            download_file_with_retry(segment_params.segment_url, proxy_headers.request),
+        )
     except Exception as e:
         return handle_exceptions(e)
 
@@ -351,8 +356,14 @@ async def get_public_ip():
     """
     Retrieves the public IP address of the MediaFlow proxy.
 
+    The address is cached for a minute, so frequent polling does not hit the lookup service on every call.
+
     Returns:
         Response: The HTTP response with the public IP address.
     """
-    ip_address_data = await request_with_retry("GET", "https://api.ipify.org?format=json", {})
-    return ip_address_data.json()
+    ip_address_data = await get_cached_public_ip()
+    if ip_address_data is None:
+        response = await request_with_retry("GET", "https://api.ipify.org?format=json", {})
+        ip_address_data = response.json()
+        await set_cache_public_ip(ip_address_data)
+    return ip_address_data
@@ -83,7 +83,7 @@ async def process_segment(
         # For DRM protected content
         now = time.time()
         decrypted_content = decrypt_segment(init_content, segment_content, key_id, key)
-        logger.info(f"Decryption of {mimetype} segment took {time.time() - now:.4f} seconds")
+        logger.debug("Decryption of %s segment took %.4f seconds", mimetype, time.time() - now)
     else:
         # For non-DRM protected content, we just concatenate init and segment content
         decrypted_content = init_content + segment_content
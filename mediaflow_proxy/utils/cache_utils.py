@@ -282,6 +282,14 @@ EXTRACTOR_CACHE = HybridCache(
     max_memory_size=50 * 1024 * 1024,
 )
 
+VIXCLOUD_VERSION_CACHE = AsyncMemoryCache(
+    max_memory_size=1024 * 1024,  # 1MB for site version strings
+)
+
+PUBLIC_IP_CACHE = AsyncMemoryCache(
+    max_memory_size=1024,  # A single small JSON document
+)
+
 
 # Specific cache implementations
 async def get_cached_init_segment(init_url: str, headers: dict) -> Optional[bytes]:
@@ -374,3 +382,35 @@ async def set_cache_extractor_result(key: str, result: dict) -> bool:
     except Exception as e:
         logger.error(f"Error caching extractor result: {e}")
         return False
+
+
+async def get_cached_vixcloud_version(domain: str) -> Optional[str]:
+    """Get VixCloud parent site version from cache."""
+    cached_data = await VIXCLOUD_VERSION_CACHE.get(domain)
+    return cached_data.decode() if cached_data is not None else None
+
+
+async def set_cache_vixcloud_version(domain: str, version: str) -> bool:
+    """Cache VixCloud parent site version."""
+    return await VIXCLOUD_VERSION_CACHE.set(domain, version.encode(), ttl=10 * 60)  # 10 minutes
+
+
+async def delete_cached_vixcloud_version(domain: str) -> bool:
+    """Remove VixCloud parent site version from cache."""
+    return await VIXCLOUD_VERSION_CACHE.delete(domain)
+
+
+async def get_cached_public_ip() -> Optional[dict]:
+    """Get public IP address data from cache."""
+    cached_data = await PUBLIC_IP_CACHE.get("public_ip")
+    if cached_data is not None:
+        try:
+            return json.loads(cached_data)
+        except json.JSONDecodeError:
+            await PUBLIC_IP_CACHE.delete("public_ip")
+    return None
+
+
+async def set_cache_public_ip(ip_address_data: dict) -> bool:
+    """Cache public IP address data."""
+    return await PUBLIC_IP_CACHE.set("public_ip", json.dumps(ip_address_data).encode(), ttl=60)  # 1 minute
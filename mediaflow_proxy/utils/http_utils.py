@@ -1,5 +1,7 @@
+import contextvars
 import logging
 import typing
+from http.cookiejar import CookieJar
 from dataclasses import dataclass
 from functools import partial
 from urllib import parse
@@ -22,6 +24,9 @@ from mediaflow_proxy.utils.crypto_utils import EncryptionHandler
 
 logger = logging.getLogger(__name__)
 
+# ASGI header names are lowercase bytes, so the allow-list is matched against the raw headers directly.
+_SUPPORTED_REQUEST_HEADER_KEYS = frozenset(header.encode("latin-1") for header in SUPPORTED_REQUEST_HEADERS)
+
 
 class DownloadError(Exception):
     def __init__(self, status_code, message):
@@ -30,13 +35,92 @@ class DownloadError(Exception):
         super().__init__(message)
 
 
-def create_httpx_client(follow_redirects: bool = True, timeout: float = 30.0, **kwargs) -> httpx.AsyncClient:
+def create_httpx_client(
+    follow_redirects: bool = True,
+    timeout: typing.Union[float, httpx.Timeout] = 30.0,
+    http2: bool = False,
+    limits: httpx.Limits = httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    **kwargs,
+) -> httpx.AsyncClient:
     """Creates an HTTPX client with configured proxy routing"""
-    mounts = settings.transport_config.get_mounts()
-    client = httpx.AsyncClient(mounts=mounts, follow_redirects=follow_redirects, timeout=timeout, **kwargs)
+    # Routed transports keep their own connection pools, so they need the same settings as the client.
+    mounts = settings.transport_config.get_mounts(http2=http2, limits=limits)
+    client = httpx.AsyncClient(
+        mounts=mounts, follow_redirects=follow_redirects, timeout=timeout, http2=http2, limits=limits, **kwargs
+    )
     return client
 
 
+_request_cookies: contextvars.ContextVar[typing.Optional[dict]] = contextvars.ContextVar(
+    "request_cookies", default=None
+)
+
+
+class RequestScopedCookieJar(CookieJar):
+    """
+    A cookie jar whose cookies only live as long as the current request context.
+
+    Every incoming request is handled in its own task, so cookies set by an upstream are visible to the
+    redirect hops and follow-up upstream requests made while handling that request, but never to other requests.
+    """
+
+    @property
+    def _cookies(self) -> dict:
+        cookies = _request_cookies.get()
+        if cookies is None:
+            cookies = {}
+            _request_cookies.set(cookies)
+        return cookies
+
+    @_cookies.setter
+    def _cookies(self, cookies: dict):
+        # CookieJar resets its store by assigning an empty dict; start a fresh one lazily instead.
+        _request_cookies.set(cookies or None)
+
+
+_shared_httpx_client: typing.Optional[httpx.AsyncClient] = None
+
+
+def get_shared_httpx_client() -> httpx.AsyncClient:
+    """
+    Returns the process-wide HTTPX client, creating it on first use.
+
+    Sharing a single client keeps upstream connections pooled across requests, so segment fetches
+    to the same host reuse an open connection instead of paying for a new TCP/TLS handshake.
+    HTTP/2 is negotiated where the upstream supports it, multiplexing parallel segment requests
+    over one connection.
+
+    Cookies are scoped to the incoming request (see RequestScopedCookieJar): the client is shared by all users,
+    so an upstream Set-Cookie must not be replayed on other users' requests.
+
+    Returns:
+        httpx.AsyncClient: The shared HTTP client.
+    """
+    global _shared_httpx_client
+    if _shared_httpx_client is None or _shared_httpx_client.is_closed:
+        _shared_httpx_client = create_httpx_client(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            cookies=RequestScopedCookieJar(),
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _shared_httpx_client
+
+
+async def close_shared_httpx_client():
+    """
+    Closes the process-wide HTTPX client, if one was created.
+    """
+    global _shared_httpx_client
+    if _shared_httpx_client is not None:
+        await _shared_httpx_client.aclose()
+        _shared_httpx_client = None
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -79,14 +163,16 @@ async def fetch_with_retry(client, method, url, headers, follow_redirects=True,
 
 
 class Streamer:
-    def __init__(self, client):
+    def __init__(self, client, chunk_size: int = 64 * 1024):
         """
         Initializes the Streamer with an HTTP client.
 
         Args:
             client (httpx.AsyncClient): The HTTP client to use for streaming.
+            chunk_size (int, optional): The size of the chunks yielded while streaming. Defaults to 64 KiB.
         """
         self.client = client
+        self.chunk_size = chunk_size
         self.response = None
         self.progress_bar = None
         self.bytes_transferred = 0
@@ -103,6 +189,8 @@ class Streamer:
             headers (dict): The headers to include in the request.
 
         """
+        if self.response:
+            await self.response.aclose()
         request = self.client.build_request("GET", url, headers=headers)
         self.response = await self.client.send(request, stream=True, follow_redirects=True)
         self.response.raise_for_status()
@@ -128,7 +216,7 @@ class Streamer:
                     ncols=100,
                     mininterval=1,
                 ) as self.progress_bar:
-                    async for chunk in self.response.aiter_bytes():
+                    async for chunk in self.response.aiter_bytes(chunk_size=self.chunk_size):
                         yield chunk
                         chunk_size = len(chunk)
                         self.bytes_transferred += chunk_size
@@ -137,7 +225,7 @@ class Streamer:
                         )
                         self.progress_bar.update(chunk_size)
             else:
-                async for chunk in self.response.aiter_bytes():
+                async for chunk in self.response.aiter_bytes(chunk_size=self.chunk_size):
                     yield chunk
                     self.bytes_transferred += len(chunk)
 
@@ -181,6 +269,8 @@ class Streamer:
         Returns:
             str: The response text.
         """
+        if self.response:
+            await self.response.aclose()
         try:
             self.response = await fetch_with_retry(self.client, "GET", url, headers)
         except tenacity.RetryError as e:
@@ -189,13 +279,14 @@ class Streamer:
 
     async def close(self):
         """
-        Closes the HTTP client and response.
+        Closes the HTTP response and progress bar.
+
+        The HTTP client is left open, as it is owned by the caller and may be shared.
         """
         if self.response:
             await self.response.aclose()
         if self.progress_bar:
             self.progress_bar.close()
-        await self.client.aclose()
 
 
 async def download_file_with_retry(url: str, headers: dict):
@@ -212,15 +303,15 @@ async def download_file_with_retry(url: str, headers: dict):
     Raises:
         DownloadError: If the download fails after retries.
     """
-    async with create_httpx_client() as client:
-        try:
-            response = await fetch_with_retry(client, "GET", url, headers)
-            return response.content
-        except DownloadError as e:
-            logger.error(f"Failed to download file: {e}")
-            raise e
-        except tenacity.RetryError as e:
-            raise DownloadError(502, f"Failed to download file: {e.last_attempt.result()}")
+    client = get_shared_httpx_client()
+    try:
+        response = await fetch_with_retry(client, "GET", url, headers)
+        return response.content
+    except DownloadError as e:
+        logger.error(f"Failed to download file: {e}")
+        raise e
+    except tenacity.RetryError as e:
+        raise DownloadError(502, f"Failed to download file: {e.last_attempt.result()}")
 
 
 async def request_with_retry(method: str, url: str, headers: dict, **kwargs) -> httpx.Response:
@@ -239,13 +330,13 @@ async def request_with_retry(method: str, url: str, headers: dict, **kwargs) ->
     Raises:
         DownloadError: If the request fails after retries.
     """
-    async with create_httpx_client() as client:
-        try:
-            response = await fetch_with_retry(client, method, url, headers, **kwargs)
-            return response
-        except DownloadError as e:
-            logger.error(f"Failed to download file: {e}")
-            raise
+    client = get_shared_httpx_client()
+    try:
+        response = await fetch_with_retry(client, method, url, headers, **kwargs)
+        return response
+    except DownloadError as e:
+        logger.error(f"Failed to download file: {e}")
+        raise
 
 
 def encode_mediaflow_proxy_url(
@@ -351,7 +442,9 @@ def get_proxy_headers(request: Request) -> ProxyRequestHeaders:
     Returns:
         ProxyRequest: A named tuple containing the request headers and response headers.
     """
-    request_headers = {k: v for k, v in request.headers.items() if k in SUPPORTED_REQUEST_HEADERS}
+    request_headers = {
+        k.decode("latin-1"): v.decode("latin-1") for k, v in request.headers.raw if k in _SUPPORTED_REQUEST_HEADER_KEYS
+    }
     request_headers.update({k[2:].lower(): v for k, v in request.query_params.items() if k.startswith("h_")})
     response_headers = {k[2:].lower(): v for k, v in request.query_params.items() if k.startswith("r_")}
     return ProxyRequestHeaders(request_headers, response_headers)
@@ -367,6 +460,7 @@ class EnhancedStreamingResponse(Response):
         headers: typing.Optional[typing.Mapping[str, str]] = None,
         media_type: typing.Optional[str] = None,
         background: typing.Optional[BackgroundTask] = None,
+        buffer_size: int = 4,
     ) -> None:
         if isinstance(content, typing.AsyncIterable):
             self.body_iterator = content
@@ -375,6 +469,7 @@ class EnhancedStreamingResponse(Response):
         self.status_code = status_code
         self.media_type = self.media_type if media_type is None else media_type
         self.background = background
+        self.buffer_size = buffer_size
         self.init_headers(headers)
 
     @staticmethod
@@ -388,6 +483,21 @@ class EnhancedStreamingResponse(Response):
         except Exception as e:
             logger.error(f"Error in listen_for_disconnect: {str(e)}")
 
+    async def buffer_body(self, send_stream: anyio.abc.ObjectSendStream) -> None:
+        """
+        Reads the body into a bounded buffer, so upstream reads overlap with sends to the client
+        while a slow client still pauses the upstream once the buffer is full.
+
+        An upstream error is passed on through the buffer rather than raised here, as raising it from the
+        task would wrap it in an ExceptionGroup and hide the original error from the stream_response log.
+        """
+        async with send_stream:
+            try:
+                async for chunk in self.body_iterator:
+                    await send_stream.send(chunk)
+            except Exception as e:
+                await send_stream.send(e)
+
     async def stream_response(self, send: Send) -> None:
         try:
             await send(
@@ -397,14 +507,24 @@ class EnhancedStreamingResponse(Response):
                     "headers": self.raw_headers,
                 }
             )
-            async for chunk in self.body_iterator:
-                if not isinstance(chunk, (bytes, memoryview)):
-                    chunk = chunk.encode(self.charset)
-                try:
-                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
-                except (ConnectionResetError, anyio.BrokenResourceError):
-                    logger.info("Client disconnected during streaming")
-                    return
+            send_stream, receive_stream = anyio.create_memory_object_stream(max_buffer_size=self.buffer_size)
+            upstream_error = None
+            async with anyio.create_task_group() as task_group, receive_stream:
+                task_group.start_soon(self.buffer_body, send_stream)
+                async for chunk in receive_stream:
+                    if isinstance(chunk, Exception):
+                        upstream_error = chunk
+                        break
+                    if not isinstance(chunk, (bytes, memoryview)):
+                        chunk = chunk.encode(self.charset)
+                    try:
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                    except (ConnectionResetError, anyio.BrokenResourceError):
+                        logger.info("Client disconnected during streaming")
+                        task_group.cancel_scope.cancel()
+                        return
+            if upstream_error is not None:
+                raise upstream_error
 
             await send({"type": "http.response.body", "body": b"", "more_body": False})
         except Exception as e: